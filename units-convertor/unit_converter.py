@@ -1,35 +1,117 @@
 import streamlit as st
 import pint
+from collections import deque
 from datetime import datetime
+import functools
 import json
 import os
-import plotly.graph_objects as go
-import pandas as pd
-
-# Initialize unit registry
-ureg = pint.UnitRegistry()
-
-# Define conversion categories with emojis and units
-CATEGORIES = {
-    "📏 Length": ["meters", "kilometers", "miles", "feet", "inches", "centimeters", "yards", "nautical_miles"],
-    "⚖️ Weight": ["kilograms", "grams", "pounds", "ounces", "tons", "milligrams"],
-    "🌡️ Temperature": ["celsius", "fahrenheit", "kelvin", "rankine"],
-    "⏰ Time": ["seconds", "minutes", "hours", "days", "weeks", "months", "years"],
-    "🧊 Volume": ["liters", "milliliters", "gallons", "cubic_meters", "cups", "tablespoons", "teaspoons"],
-    "🚀 Speed": ["meters_per_second", "kilometers_per_hour", "miles_per_hour", "knots"],
-    "💾 Data": ["bytes", "kilobytes", "megabytes", "gigabytes", "terabytes", "petabytes"],
-    "📡 Frequency": ["hertz", "kilohertz", "megahertz", "gigahertz", "terahertz"],
-    "🔋 Energy": ["joules", "kilojoules", "calories", "kilocalories", "watt_hours", "electron_volts"],
-    "⚡ Power": ["watts", "kilowatts", "megawatts", "horsepower", "btu_per_hour"],
-    "📐 Area": ["square_meters", "square_kilometers", "acres", "hectares", "square_feet", "square_yards", "square_miles"],
-    "🔩 Pressure": ["pascals", "bar", "atmospheres", "psi", "torr", "millibars"],
-    "🎛️ Electrical": ["volts", "amperes", "ohms", "farads", "henries", "siemens"],
-    "🌀 Torque": ["newton_meters", "pound_feet", "kilogram_force_meters"],
-    "📉 Density": ["kilograms_per_cubic_meter", "grams_per_cubic_centimeter", "pounds_per_cubic_foot"],
-    "💨 Airflow": ["cubic_meters_per_second", "cubic_feet_per_minute", "liters_per_minute"],
-    "💰 Currency": ["USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY"]
+from typing import Optional
+
+@st.cache_resource
+def get_ureg() -> pint.UnitRegistry:
+    """Build the unit registry once per process and share it across sessions"""
+    return pint.UnitRegistry(cache_folder=":auto:")
+
+# Define conversion categories by id, with display emojis and units
+CATEGORY_IDS = (
+    "length",
+    "weight",
+    "temperature",
+    "time",
+    "volume",
+    "speed",
+    "data",
+    "frequency",
+    "energy",
+    "power",
+    "area",
+    "pressure",
+    "electrical",
+    "torque",
+    "density",
+    "airflow",
+    "currency"
+)
+
+CATEGORY_EMOJI = {
+    "length": "📏",
+    "weight": "⚖️",
+    "temperature": "🌡️",
+    "time": "⏰",
+    "volume": "🧊",
+    "speed": "🚀",
+    "data": "💾",
+    "frequency": "📡",
+    "energy": "🔋",
+    "power": "⚡",
+    "area": "📐",
+    "pressure": "🔩",
+    "electrical": "🎛️",
+    "torque": "🌀",
+    "density": "📉",
+    "airflow": "💨",
+    "currency": "💰"
+}
+
+CATEGORY_UNITS = {
+    "length": ("meters", "kilometers", "miles", "feet", "inches", "centimeters", "yards", "nautical_miles"),
+    "weight": ("kilograms", "grams", "pounds", "ounces", "tons", "milligrams"),
+    "temperature": ("celsius", "fahrenheit", "kelvin", "rankine"),
+    "time": ("seconds", "minutes", "hours", "days", "weeks", "months", "years"),
+    "volume": ("liters", "milliliters", "gallons", "cubic_meters", "cups", "tablespoons", "teaspoons"),
+    "speed": ("meters_per_second", "kilometers_per_hour", "miles_per_hour", "knots"),
+    "data": ("bytes", "kilobytes", "megabytes", "gigabytes", "terabytes", "petabytes"),
+    "frequency": ("hertz", "kilohertz", "megahertz", "gigahertz", "terahertz"),
+    "energy": ("joules", "kilojoules", "calories", "kilocalories", "watt_hours", "electron_volts"),
+    "power": ("watts", "kilowatts", "megawatts", "horsepower", "btu_per_hour"),
+    "area": ("square_meters", "square_kilometers", "acres", "hectares", "square_feet", "square_yards", "square_miles"),
+    "pressure": ("pascals", "bar", "atmospheres", "psi", "torr", "millibars"),
+    "electrical": ("volts", "amperes", "ohms", "farads", "henries", "siemens"),
+    "torque": ("newton_meters", "pound_feet", "kilogram_force_meters"),
+    "density": ("kilograms_per_cubic_meter", "grams_per_cubic_centimeter", "pounds_per_cubic_foot"),
+    "airflow": ("cubic_meters_per_second", "cubic_feet_per_minute", "liters_per_minute"),
+    "currency": ("USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY")
 }
 
+TEMPERATURE_UNITS = frozenset(CATEGORY_UNITS["temperature"])
+
+CURRENCY_SET = frozenset(CATEGORY_UNITS["currency"])
+
+# Approximate fixed exchange rates, in units of each currency per US dollar
+CURRENCY_RATES = {
+    "USD": 1.0,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "JPY": 150.0,
+    "AUD": 1.52,
+    "CAD": 1.36,
+    "CHF": 0.88,
+    "CNY": 7.24
+}
+
+# Temperature scales as (offset, degrees per kelvin): K = (x + offset) / scale
+TEMP_SCALES = {
+    "celsius": (273.15, 1.0),
+    "fahrenheit": (459.67, 1.8),
+    "kelvin": (0.0, 1.0),
+    "rankine": (0.0, 1.8)
+}
+
+@st.cache_resource
+def get_unit_objects() -> dict:
+    """Resolve every known unit name to a pint Unit once, skipping undefined names"""
+    ureg = get_ureg()
+    unit_objects = {}
+    for units in CATEGORY_UNITS.values():
+        for unit in units:
+            if unit in TEMPERATURE_UNITS:
+                continue
+            try:
+                unit_objects[unit] = getattr(ureg, unit)
+            except pint.UndefinedUnitError:
+                pass
+    return unit_objects
+
 # Define conversion formulas
 CONVERSION_FORMULAS = {
     "temperature": {
@@ -40,10 +122,59 @@ CONVERSION_FORMULAS = {
     }
 }
 
+def format_category(category: str) -> str:
+    """Format category id for display"""
+    return f"{CATEGORY_EMOJI[category]} {category.title()}"
+
+# Lowercased category labels and unit names, built once for search
+_CAT_LOWER = {
+    k: (format_category(k).lower(), tuple(u.lower() for u in CATEGORY_UNITS[k]))
+    for k in CATEGORY_IDS
+}
+
+@functools.lru_cache(maxsize=256)
+def filter_categories(q: str) -> dict:
+    """Return the categories whose name or units match the search query"""
+    return {
+        k: CATEGORY_UNITS[k] for k, (kl, ul) in _CAT_LOWER.items()
+        if q in kl or any(q in u for u in ul)
+    }
+
+@functools.lru_cache(maxsize=256)
 def format_unit(unit: str) -> str:
     """Format unit name for display"""
+    if unit in CURRENCY_SET:  # Currency codes are already display-ready
+        return unit
     return unit.replace("_", " ").title()
 
+@functools.lru_cache(maxsize=1024)
+def _convert(value: float, from_unit: str, to_unit: str) -> Optional[float]:
+    """Convert value between units, returning None for invalid combinations"""
+    # Special handling for temperature
+    if from_unit in TEMPERATURE_UNITS:
+        if to_unit not in TEMP_SCALES:
+            return None
+        off_i, s_i = TEMP_SCALES[from_unit]
+        off_o, s_o = TEMP_SCALES[to_unit]
+        return (value + off_i) / s_i * s_o - off_o
+    
+    # Currencies are not known to pint, so use the fixed rate table
+    if from_unit in CURRENCY_SET:
+        if to_unit not in CURRENCY_RATES:
+            return None
+        return value / CURRENCY_RATES[from_unit] * CURRENCY_RATES[to_unit]
+    
+    # All other conversions
+    unit_objects = get_unit_objects()
+    if from_unit not in unit_objects or to_unit not in unit_objects:
+        return None
+    try:
+        quantity = value * unit_objects[from_unit]
+        result = quantity.to(unit_objects[to_unit])
+        return float(result.magnitude)
+    except Exception:
+        return None
+
 def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     """Convert value between units"""
     try:
@@ -51,135 +182,104 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> float:
         if not isinstance(value, (int, float)):
             st.error("Please enter a valid number")
             return None
-            
-        # Special handling for temperature
-        if from_unit in ["celsius", "fahrenheit", "kelvin", "rankine"]:
-            if from_unit == "celsius":
-                kelvin = value + 273.15
-            elif from_unit == "fahrenheit":
-                kelvin = (value + 459.67) * 5/9
-            elif from_unit == "rankine":
-                kelvin = value * 5/9
-            else:
-                kelvin = value
-            
-            if to_unit == "celsius":
-                return kelvin - 273.15
-            elif to_unit == "fahrenheit":
-                return kelvin * 9/5 - 459.67
-            elif to_unit == "rankine":
-                return kelvin * 9/5
-            else:
-                return kelvin
         
-        # All other conversions
-        try:
-            quantity = value * ureg(from_unit)
-            result = quantity.to(to_unit)
-            return float(result.magnitude)
-        except Exception as e:
+        result = _convert(value, from_unit, to_unit)
+        if result is None:
             st.error(f"Invalid unit combination: {from_unit} to {to_unit}")
-            return None
+        return result
             
     except Exception as e:
         st.error(f"Conversion Error: {str(e)}")
         return None
 
+def _current_minute_label() -> str:
+    """Current time floored to the minute"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
 def save_conversion_history(value: float, from_unit: str, to_unit: str, result: float):
     """Save conversion to history"""
     if 'conversion_history' not in st.session_state:
-        st.session_state.conversion_history = []
+        st.session_state.conversion_history = deque(maxlen=10)  # Keep only last 10 conversions
     
-    history_item = {
-        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        'value': value,
-        'from_unit': from_unit,
-        'to_unit': to_unit,
-        'result': result
-    }
+    # (timestamp, value, from_unit, to_unit, result, display)
+    display = f"{value} {format_unit(from_unit)} → {result:.2g} {format_unit(to_unit)}"
+    history_item = (datetime.now().timestamp(), value, from_unit, to_unit, result, display)
     
-    st.session_state.conversion_history.insert(0, history_item)
-    if len(st.session_state.conversion_history) > 10:  # Keep only last 10 conversions
-        st.session_state.conversion_history.pop()
+    st.session_state.conversion_history.appendleft(history_item)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def history_to_json(history: tuple) -> str:
+    """Serialize conversion history items to JSON for export"""
+    return json.dumps([
+        {
+            'timestamp': datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+            'value': value,
+            'from_unit': from_unit,
+            'to_unit': to_unit,
+            'result': result
+        }
+        for timestamp, value, from_unit, to_unit, result, _ in history
+    ], indent=2)
 
 def toggle_favorite(from_unit: str, to_unit: str):
     """Toggle favorite conversion"""
     if 'favorites' not in st.session_state:
-        st.session_state.favorites = set()
+        st.session_state.favorites = {}
     
-    conversion_pair = f"{from_unit}->{to_unit}"
+    conversion_pair = (from_unit, to_unit)
     if conversion_pair in st.session_state.favorites:
-        st.session_state.favorites.remove(conversion_pair)
+        del st.session_state.favorites[conversion_pair]
     else:
-        st.session_state.favorites.add(conversion_pair)
+        st.session_state.favorites[conversion_pair] = f"{format_unit(from_unit)} → {format_unit(to_unit)}"
 
-def create_conversion_visualization(value: float, from_unit: str, to_unit: str, result: float):
+@st.cache_resource(max_entries=64, show_spinner=False)
+def create_conversion_visualization(value: float, from_unit: str, to_unit: str, result: float, theme: str):
     """Create a visualization of the conversion"""
-    try:
-        fig = go.Figure()
-        
-        # Add bars for original and converted values
-        fig.add_trace(go.Bar(
-            name='Original',
-            x=[format_unit(from_unit)],
-            y=[value],
-            marker_color='#2E7D32'
-        ))
-        
-        fig.add_trace(go.Bar(
-            name='Converted',
-            x=[format_unit(to_unit)],
-            y=[result],
-            marker_color='#81C784'
-        ))
-        
-        fig.update_layout(
-            title='Conversion Visualization',
-            barmode='group',
-            height=300,
-            showlegend=True,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white' if st.session_state.get('theme', 'dark') == 'dark' else 'black')
-        )
-        
-        return fig
-    except Exception as e:
-        st.error(f"Visualization Error: {str(e)}")
-        return None
-
-def main():
-    st.set_page_config(
-        page_title="Unique Unit Converter",
-        page_icon="🔄",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
+    import plotly.graph_objects as go  # Deferred: only needed once a chart is drawn
     
-    # Initialize session state for theme
-    if 'theme' not in st.session_state:
-        st.session_state.theme = 'dark'
+    fig = go.Figure()
     
-    # Theme toggle in sidebar
-    with st.sidebar:
-        st.markdown("### Theme Settings")
-        if st.checkbox('🌙 Dark Mode', value=st.session_state.theme == 'dark'):
-            st.session_state.theme = 'dark'
-        else:
-            st.session_state.theme = 'light'
+    # Add bars for original and converted values
+    fig.add_trace(go.Bar(
+        name='Original',
+        x=[format_unit(from_unit)],
+        y=[value],
+        marker_color='#2E7D32'
+    ))
     
-    # Custom CSS based on theme
-    st.markdown(f"""
+    fig.add_trace(go.Bar(
+        name='Converted',
+        x=[format_unit(to_unit)],
+        y=[result],
+        marker_color='#81C784'
+    ))
+    
+    fig.update_layout(
+        title='Conversion Visualization',
+        barmode='group',
+        height=300,
+        showlegend=True,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white' if theme == 'dark' else 'black')
+    )
+    
+    return fig
+
+@functools.lru_cache(maxsize=2)
+def get_css(theme: str) -> str:
+    """Build the custom CSS for the given theme"""
+    return f"""
         <style>
         /* Main theme colors */
         :root {{
             --primary-color: #2E7D32;
             --secondary-color: #1B5E20;
             --accent-color: #81C784;
-            --text-color: {'white' if st.session_state.theme == 'dark' else 'black'};
-            --bg-color: {'#000000' if st.session_state.theme == 'dark' else '#FFFFFF'};
-            --card-bg: {'#1A1A1A' if st.session_state.theme == 'dark' else '#F0F0F0'};
-            --text-weight: {'bold' if st.session_state.theme == 'dark' else 'normal'};
+            --text-color: {'white' if theme == 'dark' else 'black'};
+            --bg-color: {'#000000' if theme == 'dark' else '#FFFFFF'};
+            --card-bg: {'#1A1A1A' if theme == 'dark' else '#F0F0F0'};
+            --text-weight: {'bold' if theme == 'dark' else 'normal'};
         }}
         
         /* Global styles */
@@ -263,7 +363,7 @@ def main():
         }}
         
         /* Button styling */
-        .stButton>button {{
+        .stButton>button, .stFormSubmitButton>button {{
             background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
             color: var(--text-color);
             border: none;
@@ -274,7 +374,7 @@ def main():
             width: 100%;
         }}
         
-        .stButton>button:hover {{
+        .stButton>button:hover, .stFormSubmitButton>button:hover {{
             transform: translateY(-2px);
             box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
         }}
@@ -319,7 +419,7 @@ def main():
             color: var(--text-color);
             font-weight: var(--text-weight);
         }}
-        ''' if st.session_state.theme == 'dark' else ''}
+        ''' if theme == 'dark' else ''}
         
         /* Search input styling */
         .stTextInput input {{
@@ -336,8 +436,86 @@ def main():
             font-weight: var(--text-weight);
         }}
         </style>
+    """
+
+@st.fragment
+def render_sidebar_cards():
+    """Render the tips, favorites, history and last-updated cards"""
+    # Sidebar information
+    st.markdown("""
+        <div class="stCard">
+            <h3>📊 Quick Tips</h3>
+            <ul>
+                <li>Select your category first</li>
+                <li>Choose source and target units</li>
+                <li>Enter the value to convert</li>
+                <li>Click Convert to see results</li>
+                <li>Use the search box to find units quickly</li>
+                <li>Toggle dark/light mode for comfort</li>
+            </ul>
+        </div>
     """, unsafe_allow_html=True)
     
+    # Favorites section
+    if 'favorites' in st.session_state and st.session_state.favorites:
+        items_html = "".join(f"<li>{label}</li>" for label in st.session_state.favorites.values())
+        st.markdown(f"""
+            <div class="stCard">
+                <h3>⭐ Favorites</h3>
+                <ul>{items_html}</ul>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    # Conversion history
+    if 'conversion_history' in st.session_state and st.session_state.conversion_history:
+        items_html = "".join(
+            f"<li>{display}<br><small>{datetime.fromtimestamp(timestamp):%Y-%m-%d %H:%M:%S}</small></li>"
+            for timestamp, *_, display in st.session_state.conversion_history
+        )
+        st.markdown(f"""
+            <div class="stCard">
+                <h3>📜 Recent Conversions</h3>
+                <ul>{items_html}</ul>
+            </div>
+        """, unsafe_allow_html=True)
+        
+        st.download_button(
+            "📥 Export History",
+            data=functools.partial(history_to_json, tuple(st.session_state.conversion_history)),
+            file_name="conversion_history.json",
+            mime="application/json"
+        )
+    
+    st.markdown("""
+        <div class="stCard">
+            <h3>Last Updated</h3>
+            <p>{}</p>
+        </div>
+    """.format(_current_minute_label()), unsafe_allow_html=True)
+
+def main():
+    st.set_page_config(
+        page_title="Unique Unit Converter",
+        page_icon="🔄",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Initialize session state for theme
+    if 'theme' not in st.session_state:
+        st.session_state.theme = 'dark'
+    
+    # Theme toggle in sidebar
+    with st.sidebar:
+        st.markdown("### Theme Settings")
+        if st.checkbox('🌙 Dark Mode', value=st.session_state.theme == 'dark'):
+            st.session_state.theme = 'dark'
+        else:
+            st.session_state.theme = 'light'
+    
+    # Custom CSS based on theme
+    st.markdown(get_css(st.session_state.theme), unsafe_allow_html=True)
+    
     # Header
     st.markdown("""
         <div class="header">
@@ -353,41 +531,42 @@ def main():
         search_query = st.text_input("🔍 Search Units", "").lower()
         
         # Filter categories based on search
-        filtered_categories = {
-            k: v for k, v in CATEGORIES.items()
-            if search_query in k.lower() or any(search_query in unit.lower() for unit in v)
-        }
+        filtered_categories = filter_categories(search_query)
         
         if not filtered_categories:
             st.warning("No units found matching your search.")
         else:
             # Main conversion interface
-            category = st.selectbox("Select Category", options=list(filtered_categories.keys()))
+            category = st.selectbox("Select Category", options=list(filtered_categories.keys()), format_func=format_category)
             units = filtered_categories[category]
             
-            # Create two columns for unit selection
-            unit_col1, unit_col2 = st.columns(2)
-            
-            with unit_col1:
-                from_unit = st.selectbox("From Unit", options=units, format_func=format_unit)
-            with unit_col2:
-                to_unit = st.selectbox("To Unit", options=units, format_func=format_unit)
+            # Batch unit and value inputs so the script only reruns on submit
+            with st.form("convert_form"):
+                # Create two columns for unit selection
+                unit_col1, unit_col2 = st.columns(2)
+                
+                with unit_col1:
+                    from_unit = st.selectbox("From Unit", options=units, format_func=format_unit)
+                with unit_col2:
+                    to_unit = st.selectbox("To Unit", options=units, format_func=format_unit)
+                
+                # Input validation for number input
+                try:
+                    input_value = st.number_input("Enter Value", value=0.0, format="%f", min_value=None, max_value=None)
+                except ValueError:
+                    st.error("Please enter a valid number")
+                    input_value = 0.0
+                
+                submitted = st.form_submit_button("Convert")
+                
+                # Favorite toggle submits the form so it uses the current selections
+                favorite_clicked = st.form_submit_button("⭐ Toggle Favorite", key="favorite_toggle")
             
-            # Input validation for number input
-            try:
-                input_value = st.number_input("Enter Value", value=0.0, format="%f", min_value=None, max_value=None)
-            except ValueError:
-                st.error("Please enter a valid number")
-                input_value = 0.0
-            
-            # Favorite toggle
-            conversion_pair = f"{from_unit}->{to_unit}"
-            is_favorite = conversion_pair in st.session_state.get('favorites', set())
-            if st.button("⭐ " + ("Remove from Favorites" if is_favorite else "Add to Favorites")):
+            if favorite_clicked:
                 toggle_favorite(from_unit, to_unit)
                 st.rerun()
             
-            if st.button("Convert", key="convert_button"):
+            if submitted:
                 result = convert_units(input_value, from_unit, to_unit)
                 if result is not None:
                     # Save to history
@@ -403,71 +582,24 @@ def main():
                     """, unsafe_allow_html=True)
                     
                     # Show conversion formula if available
-                    if category == "🌡️ Temperature":
+                    if category == "temperature":
                         formula_key = f"{from_unit}_to_{to_unit}"
                         if formula_key in CONVERSION_FORMULAS["temperature"]:
                             st.info(f"Formula: {CONVERSION_FORMULAS['temperature'][formula_key]}")
+                    elif category == "currency":
+                        st.info("Currency rates are approximate fixed values, not live market rates")
                     
                     # Show visualization with error handling
-                    fig = create_conversion_visualization(input_value, from_unit, to_unit, result)
+                    try:
+                        fig = create_conversion_visualization(input_value, from_unit, to_unit, result, st.session_state.theme)
+                    except Exception as e:
+                        st.error(f"Visualization Error: {str(e)}")
+                        fig = None
                     if fig is not None:
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(fig, width="stretch")
     
     with col2:
-        # Sidebar information
-        st.markdown("""
-            <div class="stCard">
-                <h3>📊 Quick Tips</h3>
-                <ul>
-                    <li>Select your category first</li>
-                    <li>Choose source and target units</li>
-                    <li>Enter the value to convert</li>
-                    <li>Click Convert to see results</li>
-                    <li>Use the search box to find units quickly</li>
-                    <li>Toggle dark/light mode for comfort</li>
-                </ul>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        # Favorites section
-        if 'favorites' in st.session_state and st.session_state.favorites:
-            st.markdown("""
-                <div class="stCard">
-                    <h3>⭐ Favorites</h3>
-                    <ul>
-            """, unsafe_allow_html=True)
-            
-            for fav in st.session_state.favorites:
-                from_unit, to_unit = fav.split('->')
-                st.markdown(f"<li>{format_unit(from_unit)} → {format_unit(to_unit)}</li>", unsafe_allow_html=True)
-            
-            st.markdown("</ul></div>", unsafe_allow_html=True)
-        
-        # Conversion history
-        if 'conversion_history' in st.session_state and st.session_state.conversion_history:
-            st.markdown("""
-                <div class="stCard">
-                    <h3>📜 Recent Conversions</h3>
-                    <ul>
-            """, unsafe_allow_html=True)
-            
-            for conv in st.session_state.conversion_history:
-                st.markdown(f"""
-                    <li>
-                        {conv['value']} {format_unit(conv['from_unit'])} → {conv['result']:.2g} {format_unit(conv['to_unit'])}
-                        <br>
-                        <small>{conv['timestamp']}</small>
-                    </li>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</ul></div>", unsafe_allow_html=True)
-        
-        st.markdown("""
-            <div class="stCard">
-                <h3>Last Updated</h3>
-                <p>{}</p>
-            </div>
-        """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
+        render_sidebar_cards()
     
     # Footer
     st.markdown("""